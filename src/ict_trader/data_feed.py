@@ -24,9 +24,12 @@ class BarFeed:
         self._listeners[timeframe].append(callback)
 
     def push(self, candle: Candle) -> None:
-        for callback in self._listeners.get(candle.timeframe, []):
+        for callback in self._listeners.get(candle.timeframe, ()):
             callback(candle)
 
     def replay(self, candles: Iterable[Candle]) -> None:
+        # Inline ``push`` so long replays skip a method call per candle.
+        listeners = self._listeners
         for candle in candles:
-            self.push(candle)
+            for callback in listeners.get(candle.timeframe, ()):
+                callback(candle)
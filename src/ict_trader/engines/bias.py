@@ -4,42 +4,69 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from statistics import mean
-from typing import Deque, Iterable
+from itertools import islice
+from typing import Deque
 
 from ..models import BiasSnapshot, Candle, TradeDirection
+from ..rolling import SlidingExtrema
 from ..state_store import StateStore
 
+_SHORT_ALPHA = 2 / (10 + 1)
+_LONG_ALPHA = 2 / (30 + 1)
+_SHORT_DECAY = 1 - _SHORT_ALPHA
+_LONG_DECAY = 1 - _LONG_ALPHA
+
 
 @dataclass(slots=True)
 class BiasEngine:
-    """Generates directional bias from hourly candles."""
+    """Generates directional bias from hourly candles.
+
+    The EMAs are seeded at the oldest close in the lookback window and slide
+    with it in O(1) per candle.
+    """
 
     store: StateStore
     lookback: int = 150
     confidence_floor: float = 0.55
-    candles: Deque[Candle] = field(default_factory=lambda: deque(maxlen=200))
+    max_candles: int = 200
+    closes: Deque[float] = field(init=False)
+    ema_short: float = field(init=False, default=0.0)
+    ema_long: float = field(init=False, default=0.0)
+    swing_range: SlidingExtrema = field(init=False)
+    _short_sum: float = field(init=False, default=0.0)
+    _long_sum: float = field(init=False, default=0.0)
+    _short_tail: float = field(init=False)
+    _long_tail: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        # A zero lookback means the whole buffer, as slicing with [-0:] did.
+        window = min(self.lookback or self.max_candles, self.max_candles)
+        self.swing_range = SlidingExtrema(window)
+        self.closes = deque(maxlen=window)
+        # Weight of the oldest close in a full window, removed when it expires.
+        self._short_tail = _SHORT_ALPHA * _SHORT_DECAY ** (window - 1)
+        self._long_tail = _LONG_ALPHA * _LONG_DECAY ** (window - 1)
 
     def update(self, candle: Candle) -> BiasSnapshot:
-        self.candles.append(candle)
-        if len(self.candles) < 5:
+        closes = self.closes
+        expiring = closes[0] if len(closes) == closes.maxlen else None
+        closes.append(candle.close)
+        self._update_emas(candle.close, expiring)
+        self.swing_range.push(candle.high, candle.low)
+        if len(closes) < 5:
             bias = TradeDirection.LONG if candle.close >= candle.open else TradeDirection.SHORT
             confidence = 0.5
             target = candle.close
             invalidate = candle.low if bias is TradeDirection.LONG else candle.high
         else:
-            closes = [c.close for c in self.candles][-self.lookback :]
-            highs = [c.high for c in self.candles][-self.lookback :]
-            lows = [c.low for c in self.candles][-self.lookback :]
-            ema_short = self._ema(closes, span=10)
-            ema_long = self._ema(closes, span=30)
-            bias = TradeDirection.LONG if ema_short >= ema_long else TradeDirection.SHORT
-            swing_high = max(highs)
-            swing_low = min(lows)
+            bias = TradeDirection.LONG if self.ema_short >= self.ema_long else TradeDirection.SHORT
+            swing_high = self.swing_range.max()
+            swing_low = self.swing_range.min()
             target = swing_high if bias is TradeDirection.LONG else swing_low
             invalidate = swing_low if bias is TradeDirection.LONG else swing_high
             recent_momentum = closes[-1] - closes[-5]
-            confidence = min(0.95, max(self.confidence_floor, abs(recent_momentum) / max(1e-6, mean([abs(c) for c in closes[-10:]]))))
+            mean_abs_close = sum([abs(c) for c in islice(reversed(closes), 10)]) / min(len(closes), 10)
+            confidence = min(0.95, max(self.confidence_floor, abs(recent_momentum) / max(1e-6, mean_abs_close)))
 
         snapshot = BiasSnapshot(
             symbol=candle.symbol,
@@ -52,13 +79,18 @@ class BiasEngine:
         )
         return self.store.push_bias(snapshot)
 
-    @staticmethod
-    def _ema(values: Iterable[float], span: int) -> float:
-        values = list(values)
-        if not values:
-            return 0.0
-        alpha = 2 / (span + 1)
-        ema = values[0]
-        for value in values[1:]:
-            ema = alpha * value + (1 - alpha) * ema
-        return ema
+    def _update_emas(self, close: float, expiring: float | None) -> None:
+        """Slide both EMAs after ``close`` was appended and ``expiring`` dropped."""
+        short_sum = self._short_sum
+        long_sum = self._long_sum
+        if expiring is not None:
+            short_sum -= self._short_tail * expiring
+            long_sum -= self._long_tail * expiring
+        self._short_sum = short_sum = _SHORT_DECAY * short_sum + _SHORT_ALPHA * close
+        self._long_sum = long_sum = _LONG_DECAY * long_sum + _LONG_ALPHA * close
+
+        closes = self.closes
+        size = len(closes)
+        oldest = closes[0]
+        self.ema_short = short_sum + _SHORT_DECAY**size * oldest
+        self.ema_long = long_sum + _LONG_DECAY**size * oldest
@@ -7,8 +7,13 @@ from datetime import datetime
 from typing import Deque, Optional
 
 from ..models import Candle, ExecutionSignal, StructureZone, TradeDirection
+from ..rolling import SlidingExtrema
 from ..state_store import StateStore
 
+# Bound once so the per-candle checks do a global load instead of an enum lookup.
+_LONG = TradeDirection.LONG
+_SHORT = TradeDirection.SHORT
+
 
 @dataclass(slots=True)
 class ExecutionEngine:
@@ -17,22 +22,38 @@ class ExecutionEngine:
     store: StateStore
     lookback: int = 50
     rr_target: float = 2.0
-    candles: Deque[Candle] = field(default_factory=lambda: deque(maxlen=120))
+    max_candles: int = 120
+    candles: Deque[Candle] = field(init=False)
+    prior_range: SlidingExtrema = field(init=False)
+    # Bodies of the five candles before the latest one, for the displacement average.
+    prior_bodies: Deque[float] = field(init=False, default_factory=lambda: deque(maxlen=5))
+
+    def __post_init__(self) -> None:
+        self.candles = deque(maxlen=self.max_candles)
+        # Range of the buffered candles that precede the three most recent ones;
+        # it is never fed while the buffer holds three candles or fewer.
+        self.prior_range = SlidingExtrema(max(self.max_candles - 3, 1))
 
     def evaluate(self, candle: Candle) -> Optional[ExecutionSignal]:
-        self.candles.append(candle)
-        if len(self.candles) < 5:
+        candles = self.candles
+        candles.append(candle)
+        if len(candles) > 1:
+            self.prior_bodies.append(candles[-2].body)
+        if len(candles) > 3:
+            aged = candles[-4]
+            self.prior_range.push(aged.high, aged.low)
+        if len(candles) < 5:
             return None
 
         bias = self.store.latest_bias()
-        structure = self._valid_structure(candle.timestamp)
-        if not bias or not structure:
+        if not bias:
             return None
 
-        if structure.direction != bias.bias:
+        structure = self._valid_structure(candle.timestamp)
+        if not structure or structure.direction != bias.bias:
             return None
 
-        if not structure.contains(candle.close):
+        if not structure.low <= candle.close <= structure.high:
             return None
 
         sweep_direction = self._detect_liquidity_sweep()
@@ -75,39 +96,49 @@ class ExecutionEngine:
         return structure
 
     def _detect_liquidity_sweep(self) -> Optional[TradeDirection]:
-        candles = list(self.candles)
-        recent = candles[-3:]
-        prev_range_high = max(c.high for c in candles[:-3]) if len(candles) > 3 else recent[-1].high
-        prev_range_low = min(c.low for c in candles[:-3]) if len(candles) > 3 else recent[-1].low
-
-        sweep_up = any(c.high > prev_range_high for c in recent)
-        sweep_down = any(c.low < prev_range_low for c in recent)
+        candles = self.candles
+        count = len(candles)
+        if count > 3:
+            prev_range_high = self.prior_range.max()
+            prev_range_low = self.prior_range.min()
+        else:
+            prev_range_high = candles[-1].high
+            prev_range_low = candles[-1].low
+
+        sweep_up = sweep_down = False
+        for index in range(max(-3, -count), 0):
+            recent = candles[index]
+            if recent.high > prev_range_high:
+                sweep_up = True
+            if recent.low < prev_range_low:
+                sweep_down = True
+            if sweep_up and sweep_down:
+                return None
 
-        if sweep_up and sweep_down:
-            return None
         if sweep_up:
-            return TradeDirection.SHORT
+            return _SHORT
         if sweep_down:
-            return TradeDirection.LONG
+            return _LONG
         return None
 
     def _detect_displacement_and_fvg(self) -> tuple[Optional[float], Optional[tuple[float, float]]]:
-        candles = list(self.candles)
-        c1, c2, c3 = candles[-3:]
+        candles = self.candles
+        c1, c2, c3 = candles[-3], candles[-2], candles[-1]
         displacement = c2.body
-        avg_body = sum(c.body for c in candles[-6:-1]) / 5 if len(candles) >= 6 else displacement
+        avg_body = sum(self.prior_bodies) / 5 if len(candles) >= 6 else displacement
         if displacement < avg_body * 1.2:
             return None, None
 
-        if c1.direction is TradeDirection.LONG and c2.direction is TradeDirection.LONG:
-            gap_low = max(c1.high, c2.open)
-            gap_high = min(c2.low, c3.low)
-        elif c1.direction is TradeDirection.SHORT and c2.direction is TradeDirection.SHORT:
-            gap_low = max(c2.high, c3.high)
-            gap_high = min(c1.low, c2.open)
+        # Conditional expressions avoid min()/max() call overhead on the hot path.
+        if c1.direction is not c2.direction:
+            gap_low = c1.high if c1.high <= c2.high else c2.high
+            gap_high = c1.low if c1.low >= c2.low else c2.low
+        elif c1.direction is _LONG:
+            gap_low = c1.high if c1.high >= c2.open else c2.open
+            gap_high = c2.low if c2.low <= c3.low else c3.low
         else:
-            gap_low = min(c1.high, c2.high)
-            gap_high = max(c1.low, c2.low)
+            gap_low = c2.high if c2.high >= c3.high else c3.high
+            gap_high = c1.low if c1.low <= c2.open else c2.open
 
         if gap_high <= gap_low:
             return displacement, None
@@ -131,7 +162,7 @@ class ExecutionEngine:
         stop_buffer = gap if fvg_bounds else max(0.5, gap)
         stop_distance = max(stop_buffer, 0.5)
 
-        if direction is TradeDirection.LONG:
+        if direction is _LONG:
             stop = entry - stop_distance
             default_target = entry + stop_distance * 2
             target = default_target if bias_target is None else max(default_target, bias_target)
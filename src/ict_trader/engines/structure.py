@@ -7,8 +7,11 @@ from datetime import datetime, timedelta
 from typing import Deque
 
 from ..models import Candle, StructureZone, TradeDirection
+from ..rolling import SlidingExtrema
 from ..state_store import StateStore
 
+_ZONE_LIFETIME = timedelta(minutes=60)
+
 
 @dataclass(slots=True)
 class StructureEngine:
@@ -16,17 +19,25 @@ class StructureEngine:
 
     store: StateStore
     lookback: int = 40
-    candles: Deque[Candle] = field(default_factory=lambda: deque(maxlen=100))
+    max_candles: int = 100
+    ranges: Deque[float] = field(init=False)
+    dealing_range: SlidingExtrema = field(init=False)
+
+    def __post_init__(self) -> None:
+        # A zero lookback means the whole buffer, as slicing with [-0:] did.
+        window = min(self.lookback or self.max_candles, self.max_candles)
+        self.dealing_range = SlidingExtrema(window)
+        self.ranges = deque(maxlen=window)
 
     def update(self, candle: Candle) -> StructureZone | None:
-        self.candles.append(candle)
-        if len(self.candles) < 10:
+        ranges = self.ranges
+        ranges.append(candle.high - candle.low)
+        self.dealing_range.push(candle.high, candle.low)
+        if self.dealing_range.count < 10:
             return None
 
-        highs = [c.high for c in self.candles][-self.lookback :]
-        lows = [c.low for c in self.candles][-self.lookback :]
-        avg_range = (sum(h - l for h, l in zip(highs, lows)) / len(highs)) if highs else 0
-        mid_price = (max(highs) + min(lows)) / 2
+        avg_range = sum(ranges) / len(ranges)
+        mid_price = (self.dealing_range.max() + self.dealing_range.min()) / 2
 
         last_bias = self.store.latest_bias()
         direction = last_bias.bias if last_bias else TradeDirection.LONG
@@ -37,15 +48,17 @@ class StructureEngine:
         else:
             zone_low = mid_price + avg_range * 0.1
             zone_high = zone_low + avg_range * 0.5
+        if zone_low > zone_high:
+            zone_low, zone_high = zone_high, zone_low
 
         zone = StructureZone(
             symbol=candle.symbol,
             timeframe=candle.timeframe,
             generated_at=candle.timestamp,
             direction=direction,
-            low=min(zone_low, zone_high),
-            high=max(zone_low, zone_high),
-            expires_at=candle.timestamp + timedelta(minutes=60),
+            low=zone_low,
+            high=zone_high,
+            expires_at=candle.timestamp + _ZONE_LIFETIME,
         )
         return self.store.push_structure_zone(zone)
 
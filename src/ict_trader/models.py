@@ -34,14 +34,13 @@ class Candle:
     low: float
     close: float
     volume: float = 0.0
+    # Derived once at construction; the engines read these on every candle.
+    body: float = field(init=False, repr=False, compare=False)
+    direction: TradeDirection = field(init=False, repr=False, compare=False)
 
-    @property
-    def body(self) -> float:
-        return abs(self.close - self.open)
-
-    @property
-    def direction(self) -> TradeDirection:
-        return TradeDirection.LONG if self.close >= self.open else TradeDirection.SHORT
+    def __post_init__(self) -> None:
+        self.body = abs(self.close - self.open)
+        self.direction = TradeDirection.LONG if self.close >= self.open else TradeDirection.SHORT
 
 
 @dataclass(slots=True)
@@ -100,6 +99,7 @@ class OrderPlan:
     expires_at: datetime
     bias_snapshot_id: int
     structure_zone_id: int
+    size: int = 0
     state: TradeState = TradeState.WAITING
     filled_at: Optional[datetime] = None
     exit_reason: Optional[str] = None
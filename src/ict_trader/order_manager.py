@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from .models import OrderPlan, TradeState
 from .state_store import StateStore
@@ -28,3 +28,6 @@ class OrderManager:
     def active_orders(self) -> Dict[str, OrderPlan]:
         return self.store.active_orders()
 
+    def expired_orders(self, now: datetime) -> List[OrderPlan]:
+        return self.store.pop_expired(now)
+
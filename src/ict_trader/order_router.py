@@ -1,12 +1,15 @@
 """Broker routing abstraction."""
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Protocol
 
 from .models import OrderPlan
 
+logger = logging.getLogger(__name__)
+
 
 class BrokerAPI(Protocol):
     def place_order(self, plan: OrderPlan) -> str: ...
@@ -18,9 +21,16 @@ class LoggingBroker:
     """A broker adapter that simply logs actions."""
 
     def place_order(self, plan: OrderPlan) -> str:
-        print(f"[BROKER] Placing {plan.order_type} order {plan.order_id} @ {plan.entry} (SL {plan.stop}, TP {plan.target})")
+        logger.info(
+            "[BROKER] Placing %s order %s @ %s (SL %s, TP %s)",
+            plan.order_type,
+            plan.order_id,
+            plan.entry,
+            plan.stop,
+            plan.target,
+        )
         return plan.order_id
 
     def cancel_order(self, broker_order_id: str) -> None:
-        print(f"[BROKER] Cancelling order {broker_order_id}")
+        logger.info("[BROKER] Cancelling order %s", broker_order_id)
 
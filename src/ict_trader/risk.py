@@ -15,6 +15,7 @@ class AccountState:
     daily_pnl: float = 0.0
     weekly_pnl: float = 0.0
     trades_today: int = 0
+    order_seq: int = 0
 
     def reset_daily(self) -> None:
         self.daily_pnl = 0.0
@@ -39,12 +40,8 @@ def build_order_plan(config: AgentConfig, signal: ExecutionSignal, account: Acco
         return None
 
     expiry = now + timedelta(minutes=config.risk.expiry_minutes)
-    order_id = f"{signal.symbol}-{now:%Y%m%d-%H%M%S}"
-    metadata = {
-        "size": str(size),
-        "rr": f"{signal.rr:.2f}",
-        "reason": signal.reason,
-    }
+    account.order_seq += 1
+    order_id = f"{signal.symbol}-{account.order_seq}"
 
     order = OrderPlan(
         order_id=order_id,
@@ -59,6 +56,7 @@ def build_order_plan(config: AgentConfig, signal: ExecutionSignal, account: Acco
         expires_at=expiry,
         bias_snapshot_id=signal.bias_snapshot_id,
         structure_zone_id=signal.structure_zone_id,
-        metadata=metadata,
+        size=size,
+        metadata={"reason": signal.reason},
     )
     return order
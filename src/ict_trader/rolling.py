@@ -0,0 +1,49 @@
+"""Rolling window helpers shared by the engines."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Tuple
+
+
+@dataclass(slots=True)
+class SlidingExtrema:
+    """Tracks the highest high and lowest low over the last ``window`` pushes.
+
+    Two monotonic deques keep the candidates in order so every push and query
+    is amortised O(1) instead of rescanning the window.
+    """
+
+    window: int
+    _maxima: Deque[Tuple[int, float]] = field(init=False, default_factory=deque)
+    _minima: Deque[Tuple[int, float]] = field(init=False, default_factory=deque)
+    count: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        if self.window < 1:
+            raise ValueError(f"window must be at least 1, got {self.window}")
+
+    def push(self, high: float, low: float) -> None:
+        index = self.count
+        self.count = index + 1
+        expired = index - self.window
+
+        maxima = self._maxima
+        while maxima and maxima[-1][1] <= high:
+            maxima.pop()
+        maxima.append((index, high))
+        if maxima[0][0] <= expired:
+            maxima.popleft()
+
+        minima = self._minima
+        while minima and minima[-1][1] >= low:
+            minima.pop()
+        minima.append((index, low))
+        if minima[0][0] <= expired:
+            minima.popleft()
+
+    def max(self) -> float:
+        return self._maxima[0][1]
+
+    def min(self) -> float:
+        return self._minima[0][1]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, time
+from typing import Sequence
 from zoneinfo import ZoneInfo
 
 from .config import SessionWindow
@@ -11,11 +12,11 @@ ISTANBUL_TZ = ZoneInfo("Europe/Istanbul")
 UTC = ZoneInfo("UTC")
 
 
-def current_session(now: datetime, sessions: list[SessionWindow]) -> SessionWindow | None:
-    ny_time = now.astimezone(NY_TZ)
-    session_time = ny_time.time()
+def current_session(now: datetime, sessions: Sequence[SessionWindow]) -> SessionWindow | None:
+    # astimezone() hands back ``now`` itself when it is already New York local.
+    session_time = now.astimezone(NY_TZ).time()
     for session in sessions:
-        if session.contains(session_time):
+        if session.start <= session_time <= session.end:
             return session
     return None
 
@@ -28,7 +29,7 @@ def seconds_until_session_end(now: datetime, session: SessionWindow) -> int:
     return int((end_dt - ny_time).total_seconds())
 
 
-def is_within_sessions(now: datetime, sessions: list[SessionWindow]) -> bool:
+def is_within_sessions(now: datetime, sessions: Sequence[SessionWindow]) -> bool:
     return current_session(now, sessions) is not None
 
 
@@ -1,13 +1,18 @@
 """In-memory state storage for the trading agent."""
 from __future__ import annotations
 
+import heapq
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Deque, Dict, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 
 from .models import BiasSnapshot, StructureZone, ExecutionSignal, OrderPlan, TradeState
 
+_CLOSED_STATES = frozenset({TradeState.EXIT, TradeState.CANCELLED})
+# States whose transition time is recorded in OrderPlan.filled_at.
+_STAMPED_STATES = frozenset({TradeState.FILLED, TradeState.EXIT, TradeState.CANCELLED})
+
 
 @dataclass(slots=True)
 class StateStore:
@@ -24,16 +29,20 @@ class StateStore:
     structure_zones: Deque[StructureZone] = field(init=False)
     execution_signals: Deque[ExecutionSignal] = field(init=False)
     orders: Dict[str, OrderPlan] = field(init=False, default_factory=dict)
+    # Orders not yet exited or cancelled, in registration order.
+    _active: Dict[str, OrderPlan] = field(init=False, default_factory=dict)
+    # Min-heap of (expires_at, sequence, order_id); superseded entries are skipped lazily.
+    _expiries: List[Tuple[datetime, int, str]] = field(init=False, default_factory=list)
+    _expiry_seq: int = field(init=False, default=0)
+    # Sequence of the one live heap entry for each queued order.
+    _queued: Dict[str, int] = field(init=False, default_factory=dict)
     last_bias_id: int = field(init=False, default=0)
     last_structure_id: int = field(init=False, default=0)
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "bias_snapshots", deque(maxlen=self.max_bias_snapshots))
-        object.__setattr__(self, "structure_zones", deque(maxlen=self.max_structure_zones))
-        object.__setattr__(self, "execution_signals", deque(maxlen=self.max_execution_signals))
-        object.__setattr__(self, "orders", {})
-        object.__setattr__(self, "last_bias_id", 0)
-        object.__setattr__(self, "last_structure_id", 0)
+        self.bias_snapshots = deque(maxlen=self.max_bias_snapshots)
+        self.structure_zones = deque(maxlen=self.max_structure_zones)
+        self.execution_signals = deque(maxlen=self.max_execution_signals)
 
     # Bias snapshot management -------------------------------------------------
     def push_bias(self, snapshot: BiasSnapshot) -> BiasSnapshot:
@@ -66,17 +75,58 @@ class StateStore:
     # Orders --------------------------------------------------------------------
     def register_order(self, plan: OrderPlan) -> None:
         self.orders[plan.order_id] = plan
+        if plan.state in _CLOSED_STATES:
+            self._active.pop(plan.order_id, None)
+            self._queued.pop(plan.order_id, None)
+        else:
+            self._active[plan.order_id] = plan
+            self._push_expiry(plan)
 
     def update_order_state(self, order_id: str, state: TradeState, *, when: Optional[datetime] = None, reason: str | None = None) -> None:
         order = self.orders.get(order_id)
         if not order:
             return
         order.state = state
-        if when and state in {TradeState.FILLED, TradeState.EXIT, TradeState.CANCELLED}:
+        if state in _CLOSED_STATES:
+            self._active.pop(order_id, None)
+            self._queued.pop(order_id, None)
+        elif order_id not in self._active:
+            self._active[order_id] = order
+            self._push_expiry(order)
+        if when and state in _STAMPED_STATES:
             order.filled_at = when
         if reason:
             order.exit_reason = reason
 
     def active_orders(self) -> Dict[str, OrderPlan]:
-        return {k: v for k, v in self.orders.items() if v.state not in {TradeState.EXIT, TradeState.CANCELLED}}
+        return dict(self._active)
+
+    def pop_expired(self, now: datetime) -> List[OrderPlan]:
+        """Return active orders whose expiry is at or before ``now``, oldest first.
+
+        Each order is returned once; the caller is expected to close it. An
+        ``expires_at`` moved later is picked up automatically, but one moved
+        earlier only takes effect once the plan is passed to ``register_order``
+        again.
+        """
+        expired: List[OrderPlan] = []
+        expiries = self._expiries
+        queued = self._queued
+        while expiries and expiries[0][0] <= now:
+            _, seq, order_id = heapq.heappop(expiries)
+            if queued.get(order_id) != seq:
+                continue
+            order = self._active[order_id]
+            if order.expires_at <= now:
+                del queued[order_id]
+                expired.append(order)
+            else:
+                self._push_expiry(order)
+        return expired
+
+    def _push_expiry(self, plan: OrderPlan) -> None:
+        """Queue ``plan`` at its current expiry, superseding any earlier entry."""
+        self._expiry_seq += 1
+        self._queued[plan.order_id] = self._expiry_seq
+        heapq.heappush(self._expiries, (plan.expires_at, self._expiry_seq, plan.order_id))
 
@@ -1,10 +1,11 @@
 """Supervisory guard rails for the trading agent."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Optional, Tuple
 
-from .config import AgentConfig
+from .config import AgentConfig, SessionWindow
 from .risk import AccountState
 from .sessions import current_session
 
@@ -13,17 +14,42 @@ from .sessions import current_session
 class Supervisor:
     config: AgentConfig
     account: AccountState
+    # Snapshot of config.enabled_sessions() taken when the supervisor is built.
+    sessions: Tuple[SessionWindow, ...] = field(init=False)
+    _session_at: Optional[datetime] = field(init=False, default=None)
+    _session: Optional[SessionWindow] = field(init=False, default=None)
+    # Absolute drawdown limits, recomputed only when account equity changes.
+    _limits_equity: Optional[float] = field(init=False, default=None)
+    _daily_limit: float = field(init=False, default=0.0)
+    _weekly_limit: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.sessions = tuple(self.config.enabled_sessions())
+
+    def session_at(self, now: datetime) -> Optional[SessionWindow]:
+        """Return the enabled session containing ``now``, reusing the last lookup for the same instant."""
+        if now != self._session_at:
+            self._session = current_session(now, self.sessions)
+            self._session_at = now
+        return self._session
 
     def can_trade(self, now: datetime) -> bool:
-        if self.account.trades_today >= self.config.risk.max_trades_per_day:
+        account = self.account
+        if account.trades_today >= self.config.risk.max_trades_per_day:
             return False
-        if abs(self.account.daily_pnl) >= self.config.risk.max_daily_drawdown_pct * self.account.equity:
+        if account.equity != self._limits_equity:
+            self._refresh_limits(account.equity)
+        if abs(account.daily_pnl) >= self._daily_limit:
             return False
-        if abs(self.account.weekly_pnl) >= self.config.risk.max_weekly_drawdown_pct * self.account.equity:
+        if abs(account.weekly_pnl) >= self._weekly_limit:
             return False
 
-        session = current_session(now, list(self.config.enabled_sessions()))
-        return session is not None
+        return self.session_at(now) is not None
+
+    def _refresh_limits(self, equity: float) -> None:
+        self._daily_limit = self.config.risk.max_daily_drawdown_pct * equity
+        self._weekly_limit = self.config.risk.max_weekly_drawdown_pct * equity
+        self._limits_equity = equity
 
     def record_trade(self, pnl: float) -> None:
         self.account.trades_today += 1
@@ -1,8 +1,10 @@
 """Top-level trading agent orchestrating all components."""
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterable
 
 from .config import AgentConfig, default_config
 from .data_feed import BarFeed
@@ -13,10 +15,12 @@ from .models import Candle, ExecutionSignal
 from .order_manager import OrderManager
 from .order_router import BrokerAPI, LoggingBroker
 from .risk import AccountState, build_order_plan
-from .sessions import current_session, kill_zone_label
+from .sessions import kill_zone_label
 from .state_store import StateStore
 from .supervisor import Supervisor
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class TradingAgent:
@@ -64,8 +68,9 @@ class TradingAgent:
 
     # Event handlers ---------------------------------------------------------
     def on_hourly_close(self, candle: Candle) -> None:
-        session = current_session(candle.timestamp, list(self.config.enabled_sessions()))
-        print(f"[BIAS] {candle.timestamp.isoformat()} session={kill_zone_label(session)}")
+        if logger.isEnabledFor(logging.INFO):
+            session = self.supervisor.session_at(candle.timestamp)
+            logger.info("[BIAS] %s session=%s", candle.timestamp.isoformat(), kill_zone_label(session))
         self.bias_engine.update(candle)
 
     def on_structure_close(self, candle: Candle) -> None:
@@ -83,20 +88,25 @@ class TradingAgent:
         order = build_order_plan(self.config, signal, self.supervisor.account, now)
         if not order:
             return
-        print(f"[SIGNAL] {signal.generated_at.isoformat()} direction={signal.direction} entry={signal.entry} rr={signal.rr:.2f}")
+        logger.info(
+            "[SIGNAL] %s direction=%s entry=%s rr=%.2f",
+            signal.generated_at.isoformat(),
+            signal.direction,
+            signal.entry,
+            signal.rr,
+        )
         self.order_manager.place_order(order)
         self.broker.place_order(order)
 
     def _manage_orders(self, now: datetime) -> None:
-        for order_id, order in list(self.order_manager.active_orders().items()):
-            if order.expires_at <= now:
-                self.broker.cancel_order(order_id)
-                self.order_manager.cancel_order(order_id, "expiry", now)
+        for order in self.order_manager.expired_orders(now):
+            self.broker.cancel_order(order.order_id)
+            self.order_manager.cancel_order(order.order_id, "expiry", now)
 
     # External API -----------------------------------------------------------
     def on_candle(self, candle: Candle) -> None:
         self.feed.push(candle)
 
-    def replay(self, candles: list[Candle]) -> None:
+    def replay(self, candles: Iterable[Candle]) -> None:
         self.feed.replay(candles)
 